@@ -1,10 +1,11 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime, timedelta
+import hashlib
 import os
-from utils import get_intraday_data, validate_inputs
-from arbitrage import simulate_trades, calculate_buy_hold_return, compare_frequencies
+from utils import get_intraday_data_cached, validate_inputs
+from arbitrage import simulate_trades, compare_frequencies, portfolio_trajectory
 
 # Set page title and layout
 st.set_page_config(
@@ -34,12 +35,61 @@ def clear_api_key():
     st.session_state.api_key = ""
     # Remove file if exists
     try:
-        import os
         os.remove('.api_key')
     except FileNotFoundError:
         pass
     st.success("API key cleared. You can now enter a new key.")
 
+# Content key for an intraday DataFrame, used to memoize the simulations below
+def _data_fingerprint(intraday_data):
+    columns = ['timestamp', 'open', 'high', 'low', 'close']
+    hashed = pd.util.hash_pandas_object(intraday_data[columns], index=False)
+    return hashlib.sha256(hashed.values.tobytes()).hexdigest()
+
+# Memoized simulations; the DataFrame itself is skipped by the hasher (leading underscore)
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_simulation(data_key, _intraday_data, investment_amount, trading_frequency):
+    return simulate_trades(
+        _intraday_data,
+        initial_investment=investment_amount,
+        trading_frequency=trading_frequency
+    )
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_frequency_comparison(data_key, _intraday_data, investment_amount):
+    return compare_frequencies(_intraday_data, investment_amount)
+
+# Wall-clock datetime64 values for Plotly, which ignores UTC offsets anyway;
+# avoids converting a tz-aware column element by element
+def _plot_times(timestamps):
+    return timestamps.dt.tz_localize(None).to_numpy()
+
+# Dtype for the price arrays sent to the browser. Single precision halves the
+# payload and still rounds back to the exact cent below 2**16 dollars; pricier
+# tickers keep double precision. The simulation always uses the float64 frame.
+def _display_price_dtype(intraday_data):
+    return np.float32 if intraday_data['high'].max() < 2**16 else np.float64
+
+# WebGL line trace over the bar timestamps
+def _line_trace(timestamps, values, **kwargs):
+    import plotly.graph_objects as go
+    return go.Scattergl(x=_plot_times(timestamps), y=values, mode='lines', **kwargs)
+
+# Price candlestick shared across reruns, kept as long as the data cache and for at most
+# 32 days at once; callers copy it before changing layout or traces
+@st.cache_resource(ttl=3600, max_entries=32, show_spinner=False)
+def _build_candlestick(data_key, _intraday_data):
+    import plotly.graph_objects as go
+    dtype = _display_price_dtype(_intraday_data)
+    return go.Figure(data=[go.Candlestick(
+        x=_plot_times(_intraday_data['timestamp']),
+        open=_intraday_data['open'].to_numpy(dtype=dtype),
+        high=_intraday_data['high'].to_numpy(dtype=dtype),
+        low=_intraday_data['low'].to_numpy(dtype=dtype),
+        close=_intraday_data['close'].to_numpy(dtype=dtype),
+        name="Price"
+    )])
+
 # Main title
 st.title("Intraday Stock Market Arbitrage Simulator")
 st.markdown("""
@@ -121,428 +171,6 @@ with st.sidebar.expander("API Key Settings"):
     else:
         st.info("Enter and save your API key in the form above.")
 
-# Main content area
-if submit_button:
-    # Validate inputs
-    validation_result = validate_inputs(ticker, date, investment_amount, api_key)
-    
-    if validation_result["success"]:
-        try:
-            with st.spinner('Retrieving intraday data from Polygon.io...'):
-                # Get intraday data
-                intraday_data = get_intraday_data(ticker, date, api_key)
-                
-                if intraday_data.empty:
-                    st.error(f"No intraday data available for {ticker} on {date}. Please try another date or stock.")
-                else:
-                    # Display success message
-                    st.success(f"Successfully retrieved {len(intraday_data)} data points for {ticker} on {date.strftime('%Y-%m-%d')}")
-                    
-                    # Display tabs for different sections
-                    tab1, tab2, tab3 = st.tabs(["Data & Chart", "Trade Simulation", "Performance"])
-                    
-                    with tab1:
-                        col1, col2 = st.columns([2, 3])
-                        
-                        with col1:
-                            st.subheader("Raw Intraday Data")
-                            st.dataframe(intraday_data[["timestamp", "open", "high", "low", "close", "volume"]], 
-                                        height=400)
-                        
-                        with col2:
-                            st.subheader("Intraday Price Chart")
-                            # Create candlestick chart
-                            fig = go.Figure(data=[go.Candlestick(
-                                x=intraday_data['timestamp'],
-                                open=intraday_data['open'],
-                                high=intraday_data['high'],
-                                low=intraday_data['low'],
-                                close=intraday_data['close'],
-                                name="Price"
-                            )])
-                            
-                            fig.update_layout(
-                                title=f"{ticker} Intraday Price on {date.strftime('%Y-%m-%d')}",
-                                xaxis_title="Time",
-                                yaxis_title="Price ($)",
-                                xaxis_rangeslider_visible=False,
-                                height=450
-                            )
-                            
-                            st.plotly_chart(fig, use_container_width=True)
-                    
-                    with tab2:
-                        st.subheader("Arbitrage Trading Simulation")
-                        
-                        # Simulate trades
-                        with st.spinner(f'Simulating arbitrage trading strategy with {trading_frequency} frequency...'):
-                            trades, ending_value, remaining_shares = simulate_trades(
-                                intraday_data, 
-                                initial_investment=investment_amount,
-                                trading_frequency=trading_frequency
-                            )
-                        
-                        if not trades.empty:
-                            # Display trades
-                            st.write(f"**Trading Activity**: Executed {len(trades)} trades")
-                            st.dataframe(trades, height=300)
-                            
-                            # Create trade visualization
-                            fig = go.Figure()
-                            
-                            # Add candlestick for price data
-                            fig.add_trace(go.Candlestick(
-                                x=intraday_data['timestamp'],
-                                open=intraday_data['open'],
-                                high=intraday_data['high'],
-                                low=intraday_data['low'],
-                                close=intraday_data['close'],
-                                name="Price"
-                            ))
-                            
-                            # Add buy points
-                            buy_trades = trades[trades['action'] == 'BUY']
-                            if not buy_trades.empty:
-                                fig.add_trace(go.Scatter(
-                                    x=buy_trades['timestamp'],
-                                    y=buy_trades['price'],
-                                    mode='markers',
-                                    marker=dict(color='green', size=10, symbol='triangle-up'),
-                                    name='Buy'
-                                ))
-                            
-                            # Add sell points
-                            sell_trades = trades[trades['action'] == 'SELL']
-                            if not sell_trades.empty:
-                                fig.add_trace(go.Scatter(
-                                    x=sell_trades['timestamp'],
-                                    y=sell_trades['price'],
-                                    mode='markers',
-                                    marker=dict(color='red', size=10, symbol='triangle-down'),
-                                    name='Sell'
-                                ))
-                            
-                            fig.update_layout(
-                                title=f"{ticker} Trading Activity on {date.strftime('%Y-%m-%d')}",
-                                xaxis_title="Time",
-                                yaxis_title="Price ($)",
-                                xaxis_rangeslider_visible=False,
-                                height=450
-                            )
-                            
-                            st.plotly_chart(fig, use_container_width=True)
-                        else:
-                            st.warning("No profitable trades were identified for this stock on the selected date.")
-                    
-                    with tab3:
-                        st.subheader("Performance Metrics")
-                        
-                        # Calculate buy and hold return
-                        buy_hold_value = calculate_buy_hold_return(intraday_data, investment_amount)
-                        
-                        # Calculate returns
-                        arbitrage_return_pct = ((ending_value - investment_amount) / investment_amount) * 100
-                        buy_hold_return_pct = ((buy_hold_value - investment_amount) / investment_amount) * 100
-                        
-                        # Create metrics
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            st.metric(
-                                label="Initial Investment",
-                                value=f"${investment_amount:,.2f}"
-                            )
-                        
-                        with col2:
-                            st.metric(
-                                label="Final Portfolio Value",
-                                value=f"${ending_value:,.2f}",
-                                delta=f"{arbitrage_return_pct:.2f}%"
-                            )
-                        
-                        with col3:
-                            st.metric(
-                                label="Buy & Hold Value",
-                                value=f"${buy_hold_value:,.2f}",
-                                delta=f"{buy_hold_return_pct:.2f}%"
-                            )
-                        
-                        # Display portfolio composition
-                        st.subheader("Final Portfolio Composition")
-                        
-                        last_price = intraday_data.iloc[-1]['close']
-                        shares_value = remaining_shares * last_price
-                        cash_value = ending_value - shares_value
-                        
-                        # Create pie chart for portfolio composition
-                        labels = ['Cash', f'{ticker} Shares']
-                        values = [cash_value, shares_value]
-                        
-                        fig = go.Figure(data=[go.Pie(
-                            labels=labels,
-                            values=values,
-                            hole=.4,
-                            marker_colors=['#636EFA', '#EF553B']
-                        )])
-                        
-                        fig.update_layout(
-                            title="Final Portfolio Breakdown",
-                            height=400
-                        )
-                        
-                        st.plotly_chart(fig, use_container_width=True)
-                        
-                        # Show detailed breakdown
-                        st.write(f"**Cash**: ${cash_value:,.2f}")
-                        st.write(f"**Shares**: {remaining_shares:.4f} shares of {ticker} (${shares_value:,.2f})")
-                        
-                        # Show strategy comparison
-                        st.subheader("Strategy Comparison")
-                        
-                        comparison_df = pd.DataFrame({
-                            'Strategy': ['Arbitrage Trading', 'Buy & Hold'],
-                            'Final Value': [ending_value, buy_hold_value],
-                            'Return (%)': [arbitrage_return_pct, buy_hold_return_pct],
-                            'Difference from Buy & Hold': [ending_value - buy_hold_value, 0],
-                        })
-                        
-                        st.dataframe(comparison_df.style.format({
-                            'Final Value': '${:,.2f}',
-                            'Return (%)': '{:.2f}%',
-                            'Difference from Buy & Hold': '${:,.2f}'
-                        }))
-                        
-                        # Create a strategy comparison chart
-                        st.subheader("Strategy Performance Throughout the Day")
-                        
-                        # Calculate values over time for both strategies
-                        # First, create a dataframe with timestamps
-                        performance_df = pd.DataFrame(index=intraday_data['timestamp'])
-                        
-                        # Calculate buy and hold value over time
-                        first_price = intraday_data.iloc[0]['open']
-                        buy_hold_shares = investment_amount / first_price
-                        performance_df['buy_hold_value'] = intraday_data['close'] * buy_hold_shares
-                        
-                        # Calculate arbitrage strategy value over time
-                        # Start with initial investment
-                        performance_df['arbitrage_value'] = investment_amount
-                        
-                        # Update value based on trades
-                        if not trades.empty:
-                            for idx, trade in trades.iterrows():
-                                # Find all timestamps after this trade
-                                mask = performance_df.index >= trade['timestamp']
-                                
-                                if trade['action'] == 'BUY':
-                                    # When buying, cash decreases but share value increases
-                                    performance_df.loc[mask, 'arbitrage_value'] = trade['shares'] * intraday_data.loc[intraday_data['timestamp'] >= trade['timestamp'], 'close'].values
-                                elif trade['action'] == 'SELL':
-                                    # When selling, we convert to cash
-                                    performance_df.loc[mask, 'arbitrage_value'] = trade['shares'] * trade['price']
-                        
-                        # Create the comparison chart
-                        fig = go.Figure()
-                        
-                        # Add lines for each strategy
-                        fig.add_trace(go.Scatter(
-                            x=performance_df.index,
-                            y=performance_df['arbitrage_value'],
-                            mode='lines',
-                            name='Arbitrage Strategy',
-                            line=dict(color='green', width=2)
-                        ))
-                        
-                        fig.add_trace(go.Scatter(
-                            x=performance_df.index,
-                            y=performance_df['buy_hold_value'],
-                            mode='lines',
-                            name='Buy & Hold Strategy',
-                            line=dict(color='blue', width=2)
-                        ))
-                        
-                        # Add initial investment reference line
-                        fig.add_trace(go.Scatter(
-                            x=[performance_df.index.min(), performance_df.index.max()],
-                            y=[investment_amount, investment_amount],
-                            mode='lines',
-                            name='Initial Investment',
-                            line=dict(color='gray', width=1, dash='dash')
-                        ))
-                        
-                        # Update layout
-                        fig.update_layout(
-                            title=f"Strategy Value Comparison Over Time",
-                            xaxis_title="Time",
-                            yaxis_title="Portfolio Value ($)",
-                            height=400,
-                            legend=dict(
-                                orientation="h",
-                                yanchor="bottom",
-                                y=1.02,
-                                xanchor="right",
-                                x=1
-                            )
-                        )
-                        
-                        st.plotly_chart(fig, use_container_width=True)
-                        
-                        # Performance conclusion
-                        if ending_value > buy_hold_value:
-                            st.success(f"The arbitrage strategy outperformed buy & hold by ${ending_value - buy_hold_value:,.2f} ({arbitrage_return_pct - buy_hold_return_pct:.2f}%).")
-                        elif ending_value < buy_hold_value:
-                            st.error(f"The arbitrage strategy underperformed buy & hold by ${buy_hold_value - ending_value:,.2f} ({buy_hold_return_pct - arbitrage_return_pct:.2f}%).")
-                        else:
-                            st.info("The arbitrage strategy performed exactly the same as buy & hold.")
-                            
-                        # Trading frequency comparison
-                        st.subheader("Trading Frequency Comparison")
-                        st.write("Compare how different trading frequencies affect performance:")
-                        
-                        # Run comparison across different frequencies
-                        with st.spinner("Comparing performance across different trading frequencies..."):
-                            frequency_comparison = compare_frequencies(intraday_data, investment_amount)
-                        
-                        # Format the DataFrame for display
-                        formatted_comparison = frequency_comparison.style.format({
-                            'Final Value': '${:,.2f}',
-                            'Return (%)': '{:.2f}%'
-                        })
-                        
-                        # Display the comparison table
-                        st.dataframe(formatted_comparison, height=300)
-                        
-                        # Create line chart to compare trading frequencies intraday
-                        fig = go.Figure()
-                        
-                        # Define colors for each frequency
-                        colors = {
-                            'hourly': '#1f77b4',  # blue
-                            '30min': '#ff7f0e',   # orange
-                            '15min': '#2ca02c',   # green
-                            '10min': '#d62728',   # red
-                            '5min': '#9467bd',    # purple
-                            '1min': '#8c564b'     # brown
-                        }
-                        
-                        # For each frequency, simulate and track portfolio value over time
-                        for freq in frequency_comparison['Trading Frequency']:
-                            # Simulate trades for this frequency
-                            trades_for_freq, _, _ = simulate_trades(
-                                intraday_data,
-                                investment_amount,
-                                trading_frequency=freq
-                            )
-                            
-                            # Create a dataframe with timestamps
-                            perf_df = pd.DataFrame(index=intraday_data['timestamp'])
-                            perf_df['value'] = investment_amount
-                            
-                            # Initialize with initial investment
-                            current_cash = investment_amount
-                            current_shares = 0
-                            
-                            # Process each trade and update portfolio value
-                            if not trades_for_freq.empty:
-                                # Create a copy of trades sorted by timestamp to ensure proper sequence
-                                sorted_trades = trades_for_freq.sort_values('timestamp')
-                                
-                                for idx, trade in sorted_trades.iterrows():
-                                    # Make sure the timestamp exists in the performance dataframe
-                                    if trade['timestamp'] not in perf_df.index:
-                                        continue
-                                        
-                                    # Find timestamps after this trade (inclusive)
-                                    mask = perf_df.index >= trade['timestamp']
-                                    
-                                    if trade['action'] == 'BUY':
-                                        # Convert cash to shares
-                                        current_shares = trade['shares']
-                                        current_cash = 0
-                                        
-                                        # Update values after this point
-                                        future_prices = intraday_data[intraday_data['timestamp'] >= trade['timestamp']]
-                                        for _, row in future_prices.iterrows():
-                                            # Check if timestamp exists in performance dataframe
-                                            if row['timestamp'] in perf_df.index:
-                                                perf_df.at[row['timestamp'], 'value'] = current_shares * row['close']
-                                            
-                                    elif trade['action'] == 'SELL':
-                                        # Convert shares to cash
-                                        current_cash = trade['shares'] * trade['price']
-                                        current_shares = 0
-                                        
-                                        # Update all future values to this cash amount
-                                        perf_df.loc[mask, 'value'] = current_cash
-                            
-                            # Add trace for this frequency
-                            fig.add_trace(go.Scatter(
-                                x=perf_df.index,
-                                y=perf_df['value'],
-                                mode='lines',
-                                name=freq,
-                                line=dict(color=colors.get(freq, '#000000'), width=2)
-                            ))
-                        
-                        # Add reference line for initial investment
-                        fig.add_trace(go.Scatter(
-                            x=[perf_df.index.min(), perf_df.index.max()],
-                            y=[investment_amount, investment_amount],
-                            mode='lines',
-                            name='Initial Investment',
-                            line=dict(color='gray', width=1, dash='dash')
-                        ))
-                        
-                        # Update layout
-                        fig.update_layout(
-                            title="Intraday Performance Comparison Across Trading Frequencies",
-                            xaxis_title="Time",
-                            yaxis_title="Portfolio Value ($)",
-                            height=500,
-                            yaxis=dict(tickprefix="$"),
-                            legend=dict(
-                                orientation="h",
-                                yanchor="bottom",
-                                y=1.02,
-                                xanchor="right",
-                                x=1
-                            )
-                        )
-                        
-                        st.plotly_chart(fig, use_container_width=True)
-                        
-                        # Find the best frequency
-                        best_freq_idx = frequency_comparison['Final Value'].idxmax()
-                        best_freq = frequency_comparison.iloc[best_freq_idx]
-                        
-                        st.write(f"**Best Trading Frequency:** {best_freq['Trading Frequency']} with a final value of ${best_freq['Final Value']:,.2f} ({best_freq['Return (%)']:.2f}%)")
-                        
-                        # Add a chart for number of trades by frequency
-                        fig = go.Figure()
-                        
-                        # Add bars for number of trades
-                        fig.add_trace(go.Bar(
-                            x=frequency_comparison['Trading Frequency'],
-                            y=frequency_comparison['Number of Trades'],
-                            name='Number of Trades',
-                            marker_color='green'
-                        ))
-                        
-                        # Update layout
-                        fig.update_layout(
-                            title="Number of Trades by Frequency",
-                            xaxis_title="Trading Frequency",
-                            yaxis_title="Number of Trades",
-                            height=350
-                        )
-                        
-                        st.plotly_chart(fig, use_container_width=True)
-                        
-        except Exception as e:
-            st.error(f"An error occurred during data processing: {str(e)}")
-    else:
-        st.error(validation_result["message"])
-
 # App footer information
 st.sidebar.markdown("---")
 st.sidebar.info("""
@@ -556,3 +184,459 @@ This application simulates an intraday arbitrage trading strategy using historic
 - Compare performance against buy & hold
 - Analyze impact of different trading frequencies
 """)
+
+# Main content area
+if submit_button:
+    # Validate inputs
+    validation_result = validate_inputs(ticker, date, investment_amount, api_key)
+    
+    # Stop here on invalid inputs; nothing below applies to them
+    if not validation_result["success"]:
+        st.session_state.pop('result', None)
+        st.error(validation_result["message"])
+        st.stop()
+    
+    # Every submit goes through the loader, so the current session picks up new
+    # bars; past days and repeat simulations are served from the caches
+    st.session_state.pop('result', None)
+    try:
+        with st.spinner('Retrieving intraday data from Polygon.io...'):
+            # Get intraday data
+            intraday_data = get_intraday_data_cached(ticker, date, api_key)
+        
+        if intraday_data.empty:
+            st.error(f"No intraday data available for {ticker} on {date}. Please try another date or stock.")
+        else:
+            data_key = _data_fingerprint(intraday_data)
+            
+            # Simulate trades
+            with st.spinner(f'Simulating arbitrage trading strategy with {trading_frequency} frequency...'):
+                trades, ending_value, remaining_shares = _cached_simulation(
+                    data_key,
+                    intraday_data,
+                    investment_amount,
+                    trading_frequency
+                )
+            
+            # Value of both strategies over the day; buy and hold ends at its last value
+            arbitrage_values, buy_hold_values, _ = portfolio_trajectory(
+                intraday_data, trades, investment_amount
+            )
+            buy_hold_value = float(buy_hold_values[-1])
+            
+            # Run comparison across different frequencies
+            with st.spinner("Comparing performance across different trading frequencies..."):
+                frequency_comparison = _cached_frequency_comparison(data_key, intraday_data, investment_amount)
+            
+            st.session_state['result'] = {
+                'ticker': ticker,
+                'date': date,
+                'investment_amount': investment_amount,
+                'intraday_data': intraday_data,
+                'data_key': data_key,
+                'trades': trades,
+                'ending_value': ending_value,
+                'remaining_shares': remaining_shares,
+                'buy_hold_value': buy_hold_value,
+                'arbitrage_values': arbitrage_values,
+                'buy_hold_values': buy_hold_values,
+                'frequency_comparison': frequency_comparison,
+            }
+    except Exception as e:
+        st.error(f"An error occurred during data processing: {str(e)}")
+
+# Tab renderers; each draws one part of the stored result
+def _render_data_tab(result):
+    # Plotly is only imported once there is something to chart
+    import plotly.graph_objects as go
+    
+    intraday_data = result['intraday_data']
+    data_key = result['data_key']
+    ticker = result['ticker']
+    date = result['date']
+    
+    col1, col2 = st.columns([2, 3])
+    
+    with col1:
+        st.subheader("Raw Intraday Data")
+        price_dtype = _display_price_dtype(intraday_data)
+        st.dataframe(
+            intraday_data[["timestamp", "open", "high", "low", "close", "volume"]].astype(
+                {col: price_dtype for col in ('open', 'high', 'low', 'close')}
+            ),
+            height=400,
+            column_config={
+                col: st.column_config.NumberColumn(format='dollar')
+                for col in ('open', 'high', 'low', 'close')
+            }
+        )
+    
+    with col2:
+        st.subheader("Intraday Price Chart")
+        # Create candlestick chart
+        fig = go.Figure(_build_candlestick(data_key, intraday_data))
+        
+        fig.update_layout(
+            title=f"{ticker} Intraday Price on {date.strftime('%Y-%m-%d')}",
+            xaxis_title="Time",
+            yaxis_title="Price ($)",
+            xaxis_rangeslider_visible=False,
+            height=450
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+
+def _render_trades_tab(result):
+    import plotly.graph_objects as go
+    
+    trades = result['trades']
+    intraday_data = result['intraday_data']
+    data_key = result['data_key']
+    ticker = result['ticker']
+    date = result['date']
+    
+    st.subheader("Arbitrage Trading Simulation")
+    
+    if not trades.empty:
+        # Split trades by action in a single pass
+        by_action = {action: group for action, group in trades.groupby('action', sort=False)}
+        buy_trades = by_action.get('BUY', trades.iloc[:0])
+        sell_trades = by_action.get('SELL', trades.iloc[:0])
+
+        # Display trades
+        st.write(f"**Trading Activity**: Executed {len(trades)} trades")
+        st.dataframe(
+            trades,
+            height=300,
+            column_config={
+                'price': st.column_config.NumberColumn(format='dollar'),
+                'shares': st.column_config.NumberColumn(format='%.4f'),
+                'gain_loss': st.column_config.NumberColumn(format='dollar')
+            },
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        # Collect trade markers so they are validated and added in one call
+        traces = []
+        
+        # Add buy points
+        if not buy_trades.empty:
+            traces.append(go.Scatter(
+                x=_plot_times(buy_trades['timestamp']),
+                y=buy_trades['price'].to_numpy(),
+                mode='markers',
+                marker=dict(color='green', size=10, symbol='triangle-up'),
+                name='Buy'
+            ))
+        
+        # Add sell points
+        if not sell_trades.empty:
+            traces.append(go.Scatter(
+                x=_plot_times(sell_trades['timestamp']),
+                y=sell_trades['price'].to_numpy(),
+                mode='markers',
+                marker=dict(color='red', size=10, symbol='triangle-down'),
+                name='Sell'
+            ))
+        
+        # Create trade visualization on top of the price candlestick
+        fig = go.Figure(_build_candlestick(data_key, intraday_data))
+        fig.add_traces(traces)
+        
+        fig.update_layout(
+            title=f"{ticker} Trading Activity on {date.strftime('%Y-%m-%d')}",
+            xaxis_title="Time",
+            yaxis_title="Price ($)",
+            xaxis_rangeslider_visible=False,
+            height=450
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.warning("No profitable trades were identified for this stock on the selected date.")
+
+def _render_strategy_chart(result, arbitrage_return_pct, buy_hold_return_pct):
+    import plotly.graph_objects as go
+    
+    intraday_data = result['intraday_data']
+    investment_amount = result['investment_amount']
+    ending_value = result['ending_value']
+    buy_hold_value = result['buy_hold_value']
+    arbitrage_values = result['arbitrage_values']
+    buy_hold_values = result['buy_hold_values']
+    
+    # Create a strategy comparison chart
+    st.subheader("Strategy Performance Throughout the Day")
+    
+    # Create the comparison chart
+    fig = go.Figure()
+    
+    # Add lines for each strategy
+    fig.add_trace(_line_trace(
+        intraday_data['timestamp'],
+        arbitrage_values,
+        name='Arbitrage Strategy',
+        line=dict(color='green', width=2)
+    ))
+    
+    fig.add_trace(_line_trace(
+        intraday_data['timestamp'],
+        buy_hold_values,
+        name='Buy & Hold Strategy',
+        line=dict(color='blue', width=2)
+    ))
+    
+    # Add initial investment reference line
+    fig.add_trace(go.Scattergl(
+        x=_plot_times(intraday_data['timestamp'].iloc[[0, -1]]),
+        y=[investment_amount, investment_amount],
+        mode='lines',
+        name='Initial Investment',
+        line=dict(color='gray', width=1, dash='dash')
+    ))
+    
+    # Update layout
+    fig.update_layout(
+        title=f"Strategy Value Comparison Over Time",
+        xaxis_title="Time",
+        yaxis_title="Portfolio Value ($)",
+        height=400,
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Performance conclusion
+    if ending_value > buy_hold_value:
+        st.success(f"The arbitrage strategy outperformed buy & hold by ${ending_value - buy_hold_value:,.2f} ({arbitrage_return_pct - buy_hold_return_pct:.2f}%).")
+    elif ending_value < buy_hold_value:
+        st.error(f"The arbitrage strategy underperformed buy & hold by ${buy_hold_value - ending_value:,.2f} ({buy_hold_return_pct - arbitrage_return_pct:.2f}%).")
+    else:
+        st.info("The arbitrage strategy performed exactly the same as buy & hold.")
+
+def _render_frequency_comparison(result):
+    import plotly.graph_objects as go
+    
+    intraday_data = result['intraday_data']
+    investment_amount = result['investment_amount']
+    data_key = result['data_key']
+    frequency_comparison = result['frequency_comparison']
+    
+    # Trading frequency comparison
+    st.subheader("Trading Frequency Comparison")
+    st.write("Compare how different trading frequencies affect performance:")
+    
+    # Display the comparison table, formatted by the front-end
+    st.dataframe(
+        frequency_comparison,
+        height=300,
+        column_config={
+            'Final Value': st.column_config.NumberColumn(format='dollar'),
+            'Return (%)': st.column_config.NumberColumn(format='%.2f%%')
+        },
+        hide_index=True
+    )
+    
+    # Create line chart to compare trading frequencies intraday
+    fig = go.Figure()
+    
+    # Define colors for each frequency
+    colors = {
+        'hourly': '#1f77b4',  # blue
+        '30min': '#ff7f0e',   # orange
+        '15min': '#2ca02c',   # green
+        '10min': '#d62728',   # red
+        '5min': '#9467bd',    # purple
+        '1min': '#8c564b'     # brown
+    }
+    
+    # For each frequency, simulate and track portfolio value over time
+    for freq in frequency_comparison['Trading Frequency']:
+        # Simulate trades for this frequency
+        trades_for_freq, _, _ = _cached_simulation(
+            data_key,
+            intraday_data,
+            investment_amount,
+            freq
+        )
+        freq_values, _, _ = portfolio_trajectory(intraday_data, trades_for_freq, investment_amount)
+        
+        # Add trace for this frequency
+        fig.add_trace(_line_trace(
+            intraday_data['timestamp'],
+            freq_values,
+            name=freq,
+            line=dict(color=colors.get(freq, '#000000'), width=2)
+        ))
+    
+    # Add reference line for initial investment
+    fig.add_trace(go.Scattergl(
+        x=_plot_times(intraday_data['timestamp'].iloc[[0, -1]]),
+        y=[investment_amount, investment_amount],
+        mode='lines',
+        name='Initial Investment',
+        line=dict(color='gray', width=1, dash='dash')
+    ))
+    
+    # Update layout
+    fig.update_layout(
+        title="Intraday Performance Comparison Across Trading Frequencies",
+        xaxis_title="Time",
+        yaxis_title="Portfolio Value ($)",
+        height=500,
+        yaxis=dict(tickprefix="$"),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1
+        )
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+    
+    # Find the best frequency
+    best_freq_idx = frequency_comparison['Final Value'].idxmax()
+    best_freq = frequency_comparison.iloc[best_freq_idx]
+    
+    st.write(f"**Best Trading Frequency:** {best_freq['Trading Frequency']} with a final value of ${best_freq['Final Value']:,.2f} ({best_freq['Return (%)']:.2f}%)")
+    
+    # Add a chart for number of trades by frequency
+    fig = go.Figure()
+    
+    # Add bars for number of trades
+    fig.add_trace(go.Bar(
+        x=frequency_comparison['Trading Frequency'],
+        y=frequency_comparison['Number of Trades'],
+        name='Number of Trades',
+        marker_color='green'
+    ))
+    
+    # Update layout
+    fig.update_layout(
+        title="Number of Trades by Frequency",
+        xaxis_title="Trading Frequency",
+        yaxis_title="Number of Trades",
+        height=350
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+
+def _render_performance_tab(result):
+    import plotly.graph_objects as go
+    
+    ticker = result['ticker']
+    investment_amount = result['investment_amount']
+    intraday_data = result['intraday_data']
+    ending_value = result['ending_value']
+    remaining_shares = result['remaining_shares']
+    buy_hold_value = result['buy_hold_value']
+    
+    st.subheader("Performance Metrics")
+    
+    # Calculate returns
+    arbitrage_return_pct = ((ending_value - investment_amount) / investment_amount) * 100
+    buy_hold_return_pct = ((buy_hold_value - investment_amount) / investment_amount) * 100
+    
+    # Create metrics
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric(
+            label="Initial Investment",
+            value=f"${investment_amount:,.2f}"
+        )
+    
+    with col2:
+        st.metric(
+            label="Final Portfolio Value",
+            value=f"${ending_value:,.2f}",
+            delta=f"{arbitrage_return_pct:.2f}%"
+        )
+    
+    with col3:
+        st.metric(
+            label="Buy & Hold Value",
+            value=f"${buy_hold_value:,.2f}",
+            delta=f"{buy_hold_return_pct:.2f}%"
+        )
+    
+    # Display portfolio composition
+    st.subheader("Final Portfolio Composition")
+    
+    last_price = float(intraday_data['close'].iat[-1])
+    shares_value = remaining_shares * last_price
+    cash_value = ending_value - shares_value
+    
+    # A one-slice pie adds nothing when everything is in cash; the breakdown below covers it
+    if shares_value != 0:
+        # Create pie chart for portfolio composition
+        labels = np.array(['Cash', f'{ticker} Shares'])
+        values = np.array([cash_value, shares_value])
+        
+        fig = go.Figure(data=[go.Pie(
+            labels=labels,
+            values=values,
+            hole=.4,
+            marker_colors=['#636EFA', '#EF553B']
+        )])
+        
+        fig.update_layout(
+            title="Final Portfolio Breakdown",
+            height=400
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
+    
+    # Show detailed breakdown as a single element
+    st.markdown(
+        f"**Cash**: ${cash_value:,.2f}  \n"
+        f"**Shares**: {remaining_shares:.4f} shares of {ticker} (${shares_value:,.2f})"
+    )
+    
+    # Show strategy comparison
+    st.subheader("Strategy Comparison")
+    
+    # Two rows only, so format the values up front instead of using a Styler
+    comparison_df = pd.DataFrame({
+        'Strategy': ['Arbitrage Trading', 'Buy & Hold'],
+        'Final Value': [f'${ending_value:,.2f}', f'${buy_hold_value:,.2f}'],
+        'Return (%)': [f'{arbitrage_return_pct:.2f}%', f'{buy_hold_return_pct:.2f}%'],
+        'Difference from Buy & Hold': [f'${ending_value - buy_hold_value:,.2f}', '$0.00'],
+    })
+    
+    st.dataframe(comparison_df, hide_index=True)
+    
+    _render_strategy_chart(result, arbitrage_return_pct, buy_hold_return_pct)
+    _render_frequency_comparison(result)
+
+# Render the latest results; they survive reruns triggered by other widgets
+if 'result' in st.session_state:
+    result = st.session_state['result']
+    
+    try:
+        # Display success message
+        st.success(f"Successfully retrieved {len(result['intraday_data'])} data points for {result['ticker']} on {result['date'].strftime('%Y-%m-%d')}")
+        
+        # Display tabs for different sections
+        tab1, tab2, tab3 = st.tabs(["Data & Chart", "Trade Simulation", "Performance"])
+        
+        with tab1:
+            _render_data_tab(result)
+        
+        with tab2:
+            _render_trades_tab(result)
+        
+        with tab3:
+            _render_performance_tab(result)
+    
+    except Exception as e:
+        st.error(f"An error occurred during data processing: {str(e)}")
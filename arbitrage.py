@@ -2,6 +2,131 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+# Interval duration in minutes for each supported trading frequency
+_FREQ_TABLE = {
+    'hourly': 60,
+    '30min': 30,
+    '15min': 15,
+    '10min': 10,
+    '5min': 5,
+    '1min': 1
+}
+
+def _interval_extremes(low, high, interval_id):
+    """
+    Locate the lowest low and the highest high of every interval.
+
+    Parameters:
+    -----------
+    low : numpy.ndarray
+        Low prices in chronological order
+    high : numpy.ndarray
+        High prices in chronological order
+    interval_id : numpy.ndarray
+        Non-decreasing interval number of each bar
+
+    Returns:
+    --------
+    tuple
+        (buy positions, sell positions), one entry per interval. Ties resolve
+        to the first bar like idxmin/idxmax, and an interval with no valid
+        price gets the position len(low).
+    """
+    num_bars = len(low)
+    positions = np.arange(num_bars)
+
+    # Intervals are contiguous runs of equal ids
+    starts = np.flatnonzero(np.diff(interval_id, prepend=interval_id[0] - 1))
+    lengths = np.diff(np.append(starts, num_bars))
+
+    # Per-interval extremes, ignoring missing prices
+    lowest = np.repeat(np.fmin.reduceat(low, starts), lengths)
+    highest = np.repeat(np.fmax.reduceat(high, starts), lengths)
+
+    # First position in each interval where the extreme is reached
+    buy_pos = np.minimum.reduceat(np.where(low == lowest, positions, num_bars), starts)
+    sell_pos = np.minimum.reduceat(np.where(high == highest, positions, num_bars), starts)
+
+    return buy_pos, sell_pos
+
+def _minute_of_day(intraday_data):
+    """
+    Compute the minutes since midnight (exchange time) of every bar.
+
+    Parameters:
+    -----------
+    intraday_data : pandas.DataFrame
+        DataFrame containing intraday stock data
+
+    Returns:
+    --------
+    numpy.ndarray
+        Minute of day for each row of intraday_data
+    """
+    # Loaded data carries it precomputed
+    if 'minute_of_day' in intraday_data:
+        return intraday_data['minute_of_day'].to_numpy()
+
+    timestamps = intraday_data['timestamp'].dt
+    return timestamps.hour.to_numpy() * 60 + timestamps.minute.to_numpy()
+
+def _session_bars(intraday_data):
+    """
+    Extract the bars of the trading day (9 AM to 3 PM hours) as NumPy arrays.
+
+    Parameters:
+    -----------
+    intraday_data : pandas.DataFrame
+        DataFrame containing intraday stock data (not modified)
+
+    Returns:
+    --------
+    tuple
+        (row positions, minute of day, low prices, high prices) of the bars
+        in trading hours; prices are float64 so the money math is done in
+        double precision even when the data is stored as float32
+    """
+    minute_of_day = _minute_of_day(intraday_data)
+    session = np.flatnonzero((minute_of_day >= 9 * 60) & (minute_of_day < 16 * 60))
+
+    low = intraday_data['low'].to_numpy(dtype=np.float64)[session]
+    high = intraday_data['high'].to_numpy(dtype=np.float64)[session]
+
+    return session, minute_of_day[session], low, high
+
+def _round_trips(session_bars, interval_duration):
+    """
+    Locate the buy and sell bar of every interval with a profit opportunity.
+
+    Parameters:
+    -----------
+    session_bars : tuple
+        Result of _session_bars for the intraday data
+    interval_duration : int
+        Interval length in minutes
+
+    Returns:
+    --------
+    tuple
+        (buy positions, sell positions, buy prices, sell prices) as NumPy
+        arrays in chronological order; positions index the intraday data
+    """
+    session, minute_of_day, low, high = session_bars
+    if len(session) == 0:
+        no_trades = np.empty(0, dtype=np.intp)
+        return no_trades, no_trades, np.empty(0), np.empty(0)
+
+    # Number every bar by the interval it falls in
+    interval_id = minute_of_day // interval_duration
+    buy_pos, sell_pos = _interval_extremes(low, high, interval_id)
+
+    # Trade only intervals where the lowest price comes before the highest
+    opportunity = (buy_pos < sell_pos) & (sell_pos < len(session))
+    buy_pos = buy_pos[opportunity]
+    sell_pos = sell_pos[opportunity]
+
+    return session[buy_pos], session[sell_pos], low[buy_pos], high[sell_pos]
+
 def simulate_trades(intraday_data, initial_investment, trading_frequency='10min'):
     """
     Simulate intraday arbitrage trades to maximize profit.
@@ -9,7 +134,7 @@ def simulate_trades(intraday_data, initial_investment, trading_frequency='10min'
     Parameters:
     -----------
     intraday_data : pandas.DataFrame
-        DataFrame containing intraday stock data
+        DataFrame containing intraday stock data (not modified)
     initial_investment : float
         Initial investment amount
     trading_frequency : str
@@ -20,154 +145,36 @@ def simulate_trades(intraday_data, initial_investment, trading_frequency='10min'
     tuple
         (trades DataFrame, ending_value, remaining_shares)
     """
-    # Initialize variables
-    cash = initial_investment
-    shares = 0.0
-    trades = []
-
-    # Make a copy of the DataFrame to avoid modifying the original
-    df = intraday_data.copy()
-
-    # Create intervals throughout the trading day based on trading frequency
-    trading_intervals = []
-    
-    if trading_frequency == 'hourly':
-        for hour in range(9, 16):  # 9 AM to 3 PM
-            trading_intervals.append((hour, 0))
-    elif trading_frequency == '30min':
-        for hour in range(9, 16):  # 9 AM to 3 PM
-            for minute in range(0, 60, 30):
-                trading_intervals.append((hour, minute))
-    elif trading_frequency == '15min':
-        for hour in range(9, 16):  # 9 AM to 3 PM
-            for minute in range(0, 60, 15):
-                trading_intervals.append((hour, minute))
-    elif trading_frequency == '10min':
-        for hour in range(9, 16):  # 9 AM to 3 PM
-            for minute in range(0, 60, 10):
-                trading_intervals.append((hour, minute))
-    elif trading_frequency == '5min':
-        for hour in range(9, 16):  # 9 AM to 3 PM
-            for minute in range(0, 60, 5):
-                trading_intervals.append((hour, minute))
-    elif trading_frequency == '1min':
-        for hour in range(9, 16):  # 9 AM to 3 PM
-            for minute in range(0, 60):
-                trading_intervals.append((hour, minute))
-    else:
-        # Default to 10min if invalid frequency
-        for hour in range(9, 16):  # 9 AM to 3 PM
-            for minute in range(0, 60, 10):
-                trading_intervals.append((hour, minute))
-
-    for interval in trading_intervals:
-        hour, minute = interval
-        
-        # Calculate interval duration in minutes
-        if trading_frequency == 'hourly':
-            interval_duration = 60
-        elif trading_frequency == '30min':
-            interval_duration = 30
-        elif trading_frequency == '15min':
-            interval_duration = 15
-        elif trading_frequency == '10min':
-            interval_duration = 10
-        elif trading_frequency == '5min':
-            interval_duration = 5
-        elif trading_frequency == '1min':
-            interval_duration = 1
-        else:
-            interval_duration = 10
-        
-        # Filter data for the current interval
-        if trading_frequency == '1min':
-            # For 1-minute intervals, filter exactly by hour and minute
-            interval_data = df[
-                (df['timestamp'].dt.hour == hour) & 
-                (df['timestamp'].dt.minute == minute)
-            ]
-            
-            # If no data for this specific minute, try to find the closest available data point
-            if interval_data.empty:
-                # Look for closest minute in this hour
-                hour_data = df[df['timestamp'].dt.hour == hour]
-                if not hour_data.empty:
-                    closest_minute = hour_data['timestamp'].dt.minute.iloc[
-                        (hour_data['timestamp'].dt.minute - minute).abs().argsort()[0]
-                    ]
-                    interval_data = df[
-                        (df['timestamp'].dt.hour == hour) & 
-                        (df['timestamp'].dt.minute == closest_minute)
-                    ]
-        else:
-            # For other intervals, filter by hour and minute range
-            interval_data = df[
-                (df['timestamp'].dt.hour == hour) & 
-                (df['timestamp'].dt.minute >= minute) & 
-                (df['timestamp'].dt.minute < minute + interval_duration)
-            ]
-
-        if interval_data.empty:
-            continue
-
-        # Find the lowest and highest prices within this interval
-        lowest_idx = interval_data['low'].idxmin()
-        highest_idx = interval_data['high'].idxmax()
-
-        # Check if the lowest price comes before the highest (opportunity for profit)
-        if lowest_idx < highest_idx:
-            buy_data = df.loc[lowest_idx]
-            sell_data = df.loc[highest_idx]
-
-            # Calculate the number of shares to buy (all available cash)
-            buy_price = buy_data['low']
-            shares_to_buy = cash / buy_price
-
-            # Record the buy trade
-            trades.append({
-                'timestamp': buy_data['timestamp'],
-                'action': 'BUY',
-                'price': buy_price,
-                'shares': shares_to_buy,
-                'gain_loss': 0  # No gain/loss on buy
-            })
-
-            # Update portfolio
-            cash = 0
-            shares += shares_to_buy
-
-            # Calculate the selling proceeds
-            sell_price = sell_data['high']
-            sell_value = shares * sell_price
-            gain_loss = sell_value - (buy_price * shares_to_buy)
-
-            # Record the sell trade
-            trades.append({
-                'timestamp': sell_data['timestamp'],
-                'action': 'SELL',
-                'price': sell_price,
-                'shares': shares,
-                'gain_loss': gain_loss
-            })
-
-            # Update portfolio
-            cash = sell_value
-            shares = 0
-
-    # Convert trades to DataFrame
-    trades_df = pd.DataFrame(trades)
-
-    # Calculate ending value (cash + value of remaining shares)
-    if shares > 0:
-        last_price = df.iloc[-1]['close']
-        remaining_value = shares * last_price
-    else:
-        remaining_value = 0
-
-    ending_value = cash + remaining_value
-
-    # Return trades, ending value, and remaining shares
-    return trades_df, ending_value, shares
+    # Interval duration in minutes; default to 10min if invalid frequency
+    interval_duration = _FREQ_TABLE.get(trading_frequency, 10)
+
+    buy_idx, sell_idx, buy_prices, sell_prices = _round_trips(
+        _session_bars(intraday_data), interval_duration
+    )
+    if len(buy_idx) == 0:
+        return pd.DataFrame(), initial_investment, 0.0
+
+    # Every interval invests all available cash and sells every share, so the
+    # cash after each round trip is the running product of sell/buy ratios
+    cash_after = initial_investment * np.cumprod(sell_prices / buy_prices)
+    cash_before = np.concatenate(([initial_investment], cash_after[:-1]))
+    shares_bought = cash_before / buy_prices
+    gain_loss = cash_after - cash_before
+
+    # Interleave the BUY and SELL of each interval in chronological order
+    num_trips = len(buy_idx)
+    trade_idx = np.column_stack((buy_idx, sell_idx)).ravel()
+    trades_df = pd.DataFrame({
+        'timestamp': intraday_data['timestamp'].iloc[trade_idx].reset_index(drop=True),
+        'action': np.tile(['BUY', 'SELL'], num_trips).astype(object),
+        'price': np.column_stack((buy_prices, sell_prices)).ravel(),
+        'shares': np.repeat(shares_bought, 2),
+        'gain_loss': np.column_stack((np.zeros(num_trips), gain_loss)).ravel()  # No gain/loss on buy
+    })
+
+    # All shares are sold by the end of each interval, so the ending value is
+    # the cash after the last round trip
+    return trades_df, float(cash_after[-1]), 0.0
 
 def calculate_buy_hold_return(intraday_data, initial_investment):
     """
@@ -185,9 +192,9 @@ def calculate_buy_hold_return(intraday_data, initial_investment):
     float
         Final value of the investment using buy and hold strategy
     """
-    # Get the first and last prices of the day
-    first_price = intraday_data.iloc[0]['open']
-    last_price = intraday_data.iloc[-1]['close']
+    # Get the first and last prices of the day straight from the column arrays
+    first_price = float(intraday_data['open'].values[0])
+    last_price = float(intraday_data['close'].values[-1])
 
     # Calculate the number of shares that could be purchased at the beginning of the day
     shares = initial_investment / first_price
@@ -197,6 +204,53 @@ def calculate_buy_hold_return(intraday_data, initial_investment):
 
     return ending_value
 
+def portfolio_trajectory(intraday_data, trades, initial_investment):
+    """
+    Track the value of the arbitrage and buy and hold strategies throughout the day.
+
+    Parameters:
+    -----------
+    intraday_data : pandas.DataFrame
+        DataFrame containing intraday stock data
+    trades : pandas.DataFrame
+        Trades returned by simulate_trades, in chronological order
+    initial_investment : float
+        Initial investment amount
+
+    Returns:
+    --------
+    tuple
+        (arbitrage values, buy and hold values, shares held), each a NumPy
+        array aligned with the rows of intraday_data
+    """
+    close = intraday_data['close'].to_numpy(dtype=np.float64)
+
+    # Buy and hold: everything invested at the opening price
+    first_price = float(intraday_data['open'].values[0])
+    buy_hold_values = close * (initial_investment / first_price)
+
+    if trades.empty:
+        return np.full(len(close), float(initial_investment)), buy_hold_values, np.zeros(len(close))
+
+    # Portfolio state (cash, shares) before the first trade and after each one:
+    # a BUY converts all cash into shares, a SELL converts the shares back
+    is_buy = trades['action'].to_numpy() == 'BUY'
+    trade_shares = trades['shares'].to_numpy(dtype=np.float64)
+    trade_price = trades['price'].to_numpy(dtype=np.float64)
+    cash_state = np.concatenate(([initial_investment], np.where(is_buy, 0.0, trade_shares * trade_price)))
+    shares_state = np.concatenate(([0.0], np.where(is_buy, trade_shares, 0.0)))
+
+    # Map every bar to the state in effect at that time
+    trade_pos = np.searchsorted(
+        intraday_data['timestamp'].values, trades['timestamp'].values, side='left'
+    )
+    state = np.searchsorted(trade_pos, np.arange(len(close)), side='right')
+
+    shares_held = shares_state[state]
+    arbitrage_values = cash_state[state] + shares_held * close
+
+    return arbitrage_values, buy_hold_values, shares_held
+
 def identify_hourly_opportunities(intraday_data):
     """
     Identify the best trading opportunity for each hour of the trading day.
@@ -204,46 +258,46 @@ def identify_hourly_opportunities(intraday_data):
     Parameters:
     -----------
     intraday_data : pandas.DataFrame
-        DataFrame containing intraday stock data
+        DataFrame containing intraday stock data (not modified)
 
     Returns:
     --------
     pandas.DataFrame
         DataFrame containing hourly opportunities
     """
-    # Make a copy of the DataFrame
-    df = intraday_data.copy()
-
-    # Initialize list to store opportunities
-    opportunities = []
+    # Read-only access, so no defensive copy is needed
+    df = intraday_data
 
-    # Split trading day into hourly segments
-    trading_hours = [9, 10, 11, 12, 13, 14, 15]
+    if df.empty:
+        return pd.DataFrame()
 
-    for hour in trading_hours:
-        # Filter data for the current hour
-        hour_data = df[df['timestamp'].dt.hour == hour]
+    # Split trading day into hourly segments (9 AM to 3 PM)
+    trading_hours = np.arange(9, 16)
 
-        if hour_data.empty:
-            continue
+    # Hour boundaries as int64 nanoseconds, so each hour is a binary search on
+    # the sorted timestamps rather than a mask over the whole column
+    timestamps = df['timestamp']
+    ts_ns = timestamps.to_numpy(dtype='datetime64[ns]').view('i8')
+    day_start = timestamps.iloc[0].normalize()
+    hour_bounds = day_start.value + np.append(trading_hours, 16) * pd.Timedelta(hours=1).value
+    edges = np.searchsorted(ts_ns, hour_bounds)
 
-        # Find the lowest and highest prices within this hour
-        min_price = hour_data['low'].min()
-        max_price = hour_data['high'].max()
+    # Skip hours without data; the remaining hours are contiguous runs of bars
+    has_data = edges[:-1] < edges[1:]
+    if not has_data.any():
+        return pd.DataFrame()
+    starts = edges[:-1][has_data]
 
-        # Calculate potential profit percentage
-        profit_pct = ((max_price - min_price) / min_price) * 100
+    # Find the lowest and highest prices within each hour in one pass
+    min_prices = np.fmin.reduceat(df['low'].to_numpy()[:edges[-1]], starts)
+    max_prices = np.fmax.reduceat(df['high'].to_numpy()[:edges[-1]], starts)
 
-        # Record the opportunity
-        opportunities.append({
-            'hour': hour,
-            'min_price': min_price,
-            'max_price': max_price,
-            'profit_potential_pct': profit_pct
-        })
-
-    # Convert to DataFrame
-    return pd.DataFrame(opportunities)
+    return pd.DataFrame({
+        'hour': trading_hours[has_data],
+        'min_price': min_prices,
+        'max_price': max_prices,
+        'profit_potential_pct': ((max_prices - min_prices) / min_prices) * 100
+    })
 
 
 def compare_frequencies(intraday_data, initial_investment):
@@ -262,26 +316,24 @@ def compare_frequencies(intraday_data, initial_investment):
     pandas.DataFrame
         DataFrame comparing performance across frequencies
     """
-    # List of frequencies to compare
-    frequencies = ['hourly', '30min', '15min', '10min', '5min', '1min']
-    
     # Dictionary to store results
     results = []
     
-    for freq in frequencies:
-        # Run simulation for this frequency
-        trades, ending_value, remaining_shares = simulate_trades(
-            intraday_data, 
-            initial_investment, 
-            trading_frequency=freq
-        )
-        
-        # Calculate number of trades
-        num_trades = len(trades)
-        
+    # The bars are the same for every frequency, so extract them once
+    session_bars = _session_bars(intraday_data)
+    
+    for freq, interval_duration in _FREQ_TABLE.items():
+        # Only the ending value and the trade count are needed, so skip
+        # building the trade log
+        _, _, buy_prices, sell_prices = _round_trips(session_bars, interval_duration)
+        ending_value = float(initial_investment * np.prod(sell_prices / buy_prices))
+
+        # Each round trip is one buy and one sell
+        num_trades = 2 * len(buy_prices)
+
         # Calculate return percentage
         return_pct = ((ending_value - initial_investment) / initial_investment) * 100
-        
+
         # Add to results
         results.append({
             'Trading Frequency': freq,
@@ -1,6 +1,9 @@
 import pandas as pd
 import numpy as np
+import streamlit as st
+import hashlib
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 from polygon.rest import RESTClient
 import time
 
@@ -67,50 +70,59 @@ def get_intraday_data(ticker, date, api_key):
     # Initialize REST client
     client = RESTClient(api_key)
     
-    # Format date string
-    date_str = date.strftime('%Y-%m-%d')
-    
-    # Define time range for the day
-    start_timestamp = pd.Timestamp(f"{date_str} 09:30:00", tz='America/New_York')
-    end_timestamp = pd.Timestamp(f"{date_str} 16:00:00", tz='America/New_York')
+    # Define time range for the day (exchange time), without parsing strings
+    exchange_tz = ZoneInfo('America/New_York')
+    start_timestamp = datetime(date.year, date.month, date.day, 9, 30, tzinfo=exchange_tz)
+    end_timestamp = datetime(date.year, date.month, date.day, 16, 0, tzinfo=exchange_tz)
     
     # Convert to milliseconds timestamp
     start_ms = int(start_timestamp.timestamp() * 1000)
     end_ms = int(end_timestamp.timestamp() * 1000)
     
     try:
-        # Get aggregated bars for intraday data (1-minute intervals)
-        aggs = []
-        for a in client.list_aggs(
+        # Get aggregated bars for intraday data (1-minute intervals); a regular
+        # session is at most 391 bars, well within one page, so a single request
+        # replaces the paginating iterator
+        aggs = client.get_aggs(
             ticker=ticker,
             multiplier=1,
             timespan="minute",
             from_=start_ms,
             to=end_ms,
             limit=50000
-        ):
-            aggs.append({
-                'timestamp': pd.to_datetime(a.timestamp, unit='ms', utc=True).tz_convert('America/New_York'),
-                'open': a.open,
-                'high': a.high,
-                'low': a.low,
-                'close': a.close,
-                'volume': a.volume,
-                'transactions': getattr(a, 'transactions', None),
-            })
+        )
         
-        # Create DataFrame
-        df = pd.DataFrame(aggs)
+        # Create DataFrame column by column, converting all timestamps at once
+        df = pd.DataFrame({
+            'timestamp': pd.to_datetime([a.timestamp for a in aggs], unit='ms', utc=True).tz_convert('America/New_York'),
+            'open': [a.open for a in aggs],
+            'high': [a.high for a in aggs],
+            'low': [a.low for a in aggs],
+            'close': [a.close for a in aggs],
+            'volume': [a.volume for a in aggs],
+            'transactions': [getattr(a, 'transactions', None) for a in aggs],
+        })
         
         # Handle empty data
         if df.empty:
             return pd.DataFrame()
         
         # Sort by timestamp
-        df = df.sort_values('timestamp')
+        df = df.sort_values('timestamp', ignore_index=True)
+        
+        # Handle missing data using forward fill; bars that already form a
+        # gapless 1-minute grid are left as they are
+        if not (df['timestamp'].diff().iloc[1:] == pd.Timedelta(minutes=1)).all():
+            df = df.set_index('timestamp').resample('1min').ffill().reset_index()
         
-        # Handle missing data using forward fill
-        df = df.set_index('timestamp').resample('1min').ffill().reset_index()
+        # Prices stay in double precision, since the simulation compounds them;
+        # volume is narrowed to 32 bits only when every bar fits, instead of wrapping
+        fits_int32 = df['volume'].max() <= np.iinfo(np.int32).max
+        df['volume'] = df['volume'].astype('int32' if fits_int32 else 'int64')
+        
+        # Minute of day (exchange time) of every bar, used to bucket trading
+        # intervals; at most 1439, so 16 bits are enough
+        df['minute_of_day'] = (df['timestamp'].dt.hour * 60 + df['timestamp'].dt.minute).astype('int16')
         
         return df
     
@@ -121,6 +133,51 @@ def get_intraday_data(ticker, date, api_key):
         # Return empty DataFrame on error
         return pd.DataFrame()
 
+class _NoIntradayData(Exception):
+    """Raised inside the cached fetch so that an empty result is never cached."""
+
+@st.cache_data(ttl=3600, show_spinner=False,
+               hash_funcs={str: lambda s: hashlib.sha256(s.encode()).digest()})
+def _fetch_intraday_data(ticker, date, api_key):
+    # st.cache_data does not store a call that raises, so a failed or empty
+    # fetch is retried on the next request instead of being served for an hour
+    df = get_intraday_data(ticker, date, api_key)
+    if df.empty:
+        raise _NoIntradayData
+    return df
+
+def get_intraday_data_cached(ticker, date, api_key):
+    """
+    Cached version of get_intraday_data.
+    
+    Repeat requests for the same ticker and past date within an hour are served
+    without contacting Polygon.io. Empty results, including failed requests, are
+    not cached, and neither is the current session, whose bars are still coming
+    in. String arguments, including the API key, only enter the cache key as
+    SHA-256 digests.
+    
+    Parameters:
+    -----------
+    ticker : str
+        Stock ticker symbol
+    date : datetime.date
+        Date for which to retrieve data
+    api_key : str
+        Polygon.io API key
+    
+    Returns:
+    --------
+    pandas.DataFrame
+        DataFrame containing intraday stock data
+    """
+    if date >= datetime.now(ZoneInfo('America/New_York')).date():
+        return get_intraday_data(ticker, date, api_key)
+    
+    try:
+        return _fetch_intraday_data(ticker, date, api_key)
+    except _NoIntradayData:
+        return pd.DataFrame()
+
 def format_trade_log(trades):
     """
     Format the trade log for display.
@@ -138,16 +195,14 @@ def format_trade_log(trades):
     if trades.empty:
         return pd.DataFrame()
     
-    # Format timestamps and trade details
-    formatted_trades = trades.copy()
-    formatted_trades['timestamp'] = formatted_trades['timestamp'].dt.strftime('%H:%M:%S')
-    
-    # Add formatted columns
-    formatted_trades['price_fmt'] = formatted_trades['price'].map('${:.2f}'.format)
-    formatted_trades['shares_fmt'] = formatted_trades['shares'].map('{:.4f}'.format)
-    
-    # Format gain/loss
-    formatted_trades['gain_loss_fmt'] = formatted_trades['gain_loss'].map('${:.2f}'.format)
-    formatted_trades.loc[formatted_trades['action'] == 'BUY', 'gain_loss_fmt'] = 'N/A'
-    
-    return formatted_trades[['timestamp', 'action', 'price_fmt', 'shares_fmt', 'gain_loss_fmt']]
+    # Build the display columns directly instead of copying and rewriting the frame;
+    # formatting plain Python floats skips pandas' per-element map machinery
+    gain_loss_fmt = list(map('${:.2f}'.format, trades['gain_loss'].tolist()))
+    return pd.DataFrame({
+        'timestamp': trades['timestamp'].dt.strftime('%H:%M:%S'),
+        'action': trades['action'],
+        'price_fmt': list(map('${:.2f}'.format, trades['price'].tolist())),
+        'shares_fmt': list(map('{:.4f}'.format, trades['shares'].tolist())),
+        # No gain/loss on buys
+        'gain_loss_fmt': np.where(trades['action'].to_numpy() == 'BUY', 'N/A', gain_loss_fmt).astype(object)
+    })